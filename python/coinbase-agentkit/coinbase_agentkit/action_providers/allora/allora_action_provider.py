@@ -1,9 +1,11 @@
 """Allora Network action provider."""
 
 import asyncio
+import atexit
 import json
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
 
 from allora_sdk.v2.api_client import (
     AlloraAPIClient,
@@ -18,6 +20,66 @@ from ..action_decorator import create_action
 from ..action_provider import ActionProvider
 from .schemas import GetAllTopicsInput, GetInferenceByTopicIdInput, GetPriceInferenceInput
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+T = TypeVar("T")
+
+
+class _EventLoopThread:
+    """A single event loop running in a daemon thread, shared by all Allora action providers.
+
+    Submitting coroutines to one long-lived loop avoids creating and tearing down a new event
+    loop for every action invocation. When uvloop is installed, the loop is a uvloop loop.
+    """
+
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the background loop and block until it completes.
+
+        Args:
+            coro: The coroutine to run
+
+        Returns:
+            The result of the coroutine
+
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result()
+
+    def stop(self) -> None:
+        """Stop the background loop and wait for its thread to exit."""
+        with self._lock:
+            if self._loop is None or self._thread is None:
+                return
+
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background loop, starting it on first use."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="allora-event-loop", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.stop)
+
+            return self._loop
+
+
+_event_loop_thread = _EventLoopThread()
+
 
 def _convert_to_dict(obj: Any) -> dict[str, Any]:
     """Convert an object to a dictionary.
@@ -66,8 +128,6 @@ class AlloraActionProvider(ActionProvider[WalletProvider]):
             api_key=api_key or default_api_key,
             chain_slug=chain_slug or ChainSlug.TESTNET,
         )
-        # Create a thread pool executor for running async code
-        self._executor = ThreadPoolExecutor(max_workers=5)
 
     def _run_async(self, coro):
         """Run an async coroutine in a synchronous context.
@@ -79,11 +139,7 @@ class AlloraActionProvider(ActionProvider[WalletProvider]):
             The result of the coroutine
 
         """
-        loop = asyncio.new_event_loop()
-        try:
-            return loop.run_until_complete(coro)
-        finally:
-            loop.close()
+        return _event_loop_thread.run(coro)
 
     @create_action(
         name="get_all_topics",
@@ -16,6 +16,7 @@ from .constants import (
     L2_RESOLVER_ADDRESS_TESTNET,
     REGISTRAR_ABI,
     REGISTRATION_DURATION,
+    SUPPORTED_NETWORKS,
 )
 from .schemas import RegisterBasenameSchema
 
@@ -109,10 +110,7 @@ Basename fails, you should prompt to try again with a more unique name.
             bool: Whether the network is supported.
 
         """
-        return network.protocol_family == "evm" and network.network_id in [
-            "base-mainnet",
-            "base-sepolia",
-        ]
+        return network.protocol_family == "evm" and network.network_id in SUPPORTED_NETWORKS
 
 
 def basename_action_provider() -> BasenameActionProvider:
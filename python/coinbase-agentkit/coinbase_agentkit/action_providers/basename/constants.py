@@ -1,5 +1,7 @@
 """Constants for Basename action provider."""
 
+SUPPORTED_NETWORKS = frozenset({"base-mainnet", "base-sepolia"})
+
 # Contract addresses
 BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_MAINNET = "0x4cCb0BB02FCABA27e82a56646E81d8c5bC4119a5"
 BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_TESTNET = "0x49aE3cC2e3AA768B1e5654f5D3C6002144A59581"
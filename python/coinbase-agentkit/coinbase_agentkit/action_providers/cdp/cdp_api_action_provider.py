@@ -53,18 +53,28 @@ You are not allowed to faucet with any other network or asset ID. If you are on
 from another wallet and provide the user with your wallet details.""",
         schema=RequestFaucetFundsSchema,
     )
-    def request_faucet_funds(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+    def request_faucet_funds(
+        self,
+        wallet_provider: EvmWalletProvider,
+        args: RequestFaucetFundsSchema | dict[str, Any],
+    ) -> str:
         """Request test tokens from the Base Sepolia faucet.
 
         Args:
             wallet_provider (EvmWalletProvider): The wallet provider instance.
-            args (dict[str, Any]): Input arguments for the action.
+            args (RequestFaucetFundsSchema | dict[str, Any]): Input arguments for the action,
+                either already validated or as a dictionary.
 
         Returns:
             str: A message containing the action response or error details.
 
         """
-        validated_args = RequestFaucetFundsSchema(**args)
+        validated_args = (
+            args
+            if isinstance(args, RequestFaucetFundsSchema)
+            else RequestFaucetFundsSchema.model_validate(args)
+        )
+        asset_id = validated_args.asset_id
 
         try:
             network = wallet_provider.get_network()
@@ -76,10 +86,10 @@ from another wallet and provide the user with your wallet details.""",
                 wallet_provider.get_address(),
             )
 
-            faucet_tx = address.faucet(validated_args.asset_id)
+            faucet_tx = address.faucet(asset_id)
             faucet_tx.wait()
 
-            asset_str = validated_args.asset_id or "ETH"
+            asset_str = asset_id or "ETH"
             return (
                 f"Received {asset_str} from the faucet. Transaction: {faucet_tx.transaction_link}"
             )
@@ -1,6 +1,6 @@
 """Constants for Compound action provider."""
 
-SUPPORTED_NETWORKS = ["base-mainnet", "base-sepolia"]
+SUPPORTED_NETWORKS = frozenset({"base-mainnet", "base-sepolia"})
 
 # Compound Comet ABI for interacting with the protocol
 COMET_ABI = [
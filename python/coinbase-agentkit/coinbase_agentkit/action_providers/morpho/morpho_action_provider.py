@@ -17,7 +17,7 @@ from coinbase_agentkit.action_providers.morpho.utils import approve
 from coinbase_agentkit.network import Network
 from coinbase_agentkit.wallet_providers import EvmWalletProvider
 
-SUPPORTED_NETWORKS = ["base-mainnet", "base-sepolia"]
+SUPPORTED_NETWORKS = frozenset({"base-mainnet", "base-sepolia"})
 
 
 class MorphoActionProvider(ActionProvider[EvmWalletProvider]):
@@ -14,14 +14,18 @@ from .network import (
     CHAIN_ID_TO_NETWORK_ID,
     NETWORK_ID_TO_CHAIN,
     NETWORK_ID_TO_CHAIN_ID,
+    NETWORK_ID_TO_CHAIN_INFO,
+    ChainInfo,
     Network,
 )
 
 __all__ = [
     "Network",
+    "ChainInfo",
     "CHAIN_ID_TO_NETWORK_ID",
     "NETWORK_ID_TO_CHAIN_ID",
     "NETWORK_ID_TO_CHAIN",
+    "NETWORK_ID_TO_CHAIN_INFO",
     "mainnet",
     "sepolia",
     "base_sepolia",
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from pydantic import BaseModel
 
 from .chain_definitions import (
@@ -14,6 +16,14 @@ from .chain_definitions import (
 )
 
 
+@dataclass(frozen=True, slots=True)
+class ChainInfo:
+    """The chain details wallet providers need to connect to a network."""
+
+    id: str
+    rpc_url: str
+
+
 class Network(BaseModel):
     """Represents a blockchain network."""
 
@@ -54,3 +64,9 @@ NETWORK_ID_TO_CHAIN: dict[str, dict] = {
     "optimism-mainnet": optimism,
     "optimism-sepolia": optimism_sepolia,
 }
+
+# Maps Coinbase network IDs to the chain ID and default JSON-RPC URL of each chain
+NETWORK_ID_TO_CHAIN_INFO: dict[str, ChainInfo] = {
+    network_id: ChainInfo(id=chain.id, rpc_url=chain.rpc_urls["default"].http[0])
+    for network_id, chain in NETWORK_ID_TO_CHAIN.items()
+}
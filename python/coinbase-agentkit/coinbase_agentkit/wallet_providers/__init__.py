@@ -1,6 +1,11 @@
 """Wallet providers for AgentKit."""
 
-from .cdp_wallet_provider import CdpProviderConfig, CdpWalletProvider, CdpWalletProviderConfig
+from .cdp_wallet_provider import (
+    BatchTransferError,
+    CdpProviderConfig,
+    CdpWalletProvider,
+    CdpWalletProviderConfig,
+)
 from .eth_account_wallet_provider import EthAccountWalletProvider, EthAccountWalletProviderConfig
 from .evm_wallet_provider import EvmWalletProvider
 from .smart_wallet_provider import SmartWalletProvider, SmartWalletProviderConfig
@@ -9,6 +14,7 @@ from .wallet_provider import WalletProvider
 __all__ = [
     "WalletProvider",
     "EvmWalletProvider",
+    "BatchTransferError",
     "CdpProviderConfig",
     "CdpWalletProvider",
     "CdpWalletProviderConfig",
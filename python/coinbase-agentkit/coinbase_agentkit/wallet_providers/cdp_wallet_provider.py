@@ -6,9 +6,9 @@ from decimal import Decimal
 from typing import Any
 
 from cdp import (
-    Cdp,
     ExternalAddress,
     MnemonicSeedPhrase,
+    Transaction,
     Wallet,
     WalletData,
     hash_message,
@@ -16,12 +16,55 @@ from cdp import (
 )
 from eth_account.typed_transactions import DynamicFeeTransaction
 from pydantic import BaseModel, Field
+from requests.exceptions import HTTPError
 from web3 import Web3
-from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+from web3.exceptions import BadResponseFormat, RequestTimedOut, Web3RPCError, Web3TypeError
+from web3.types import BlockData, BlockIdentifier, ChecksumAddress, HexStr, Nonce, TxParams
+
+from ..network import NETWORK_ID_TO_CHAIN_INFO, Network
+from .evm_wallet_provider import (
+    ContractCache,
+    EvmGasConfig,
+    EvmWalletProvider,
+    configure_cdp,
+    ether_to_wei,
+    get_web3,
+)
+
+ERC20_TRANSFER_ABI = [
+    {
+        "type": "function",
+        "name": "transfer",
+        "stateMutability": "nonpayable",
+        "inputs": [
+            {"name": "recipient", "type": "address"},
+            {"name": "amount", "type": "uint256"},
+        ],
+        "outputs": [{"name": "", "type": "bool"}],
+    }
+]
+
 
-from ..__version__ import __version__
-from ..network import NETWORK_ID_TO_CHAIN, Network
-from .evm_wallet_provider import EvmGasConfig, EvmWalletProvider
+class BatchTransferError(Exception):
+    """Raised when a batch of transfers fails after some of them may already have been sent.
+
+    Attributes:
+        tx_hashes (list[str | None]): The transaction hashes of the transfers that were
+            broadcast before the failure, in the same order as the requested transfers. These
+            transfers may still confirm, so they should not be retried.
+
+    """
+
+    def __init__(self, message: str, tx_hashes: list[str | None]):
+        """Initialize the error.
+
+        Args:
+            message (str): The error message
+            tx_hashes (list[str | None]): The transaction hashes of the broadcast transfers
+
+        """
+        super().__init__(message)
+        self.tx_hashes = tx_hashes
 
 
 class CdpProviderConfig(BaseModel):
@@ -61,15 +104,7 @@ class CdpWalletProvider(EvmWalletProvider):
             api_key_name = config.api_key_name or os.getenv("CDP_API_KEY_NAME")
             api_key_private_key = config.api_key_private_key or os.getenv("CDP_API_KEY_PRIVATE_KEY")
 
-            if api_key_name and api_key_private_key:
-                Cdp.configure(
-                    api_key_name=api_key_name,
-                    private_key=api_key_private_key.replace("\\n", "\n"),
-                    source="agentkit",
-                    source_version=__version__,
-                )
-            else:
-                Cdp.configure_from_json(source="agentkit", source_version=__version__)
+            configure_cdp(api_key_name, api_key_private_key)
 
             network_id = config.network_id or os.getenv("NETWORK_ID", "base-sepolia")
 
@@ -86,16 +121,17 @@ class CdpWalletProvider(EvmWalletProvider):
             else:
                 self._wallet = Wallet.create(network_id=network_id)
 
-            chain = NETWORK_ID_TO_CHAIN[network_id]
-            rpc_url = chain.rpc_urls["default"].http[0]
+            chain_info = NETWORK_ID_TO_CHAIN_INFO[network_id]
 
             self._address = self._wallet.default_address.address_id
             self._network = Network(
                 protocol_family="evm",
                 network_id=network_id,
-                chain_id=chain.id,
+                chain_id=chain_info.id,
             )
-            self._web3 = Web3(Web3.HTTPProvider(rpc_url))
+            self._chain_id = int(chain_info.id)
+            self._web3 = get_web3(chain_info.rpc_url)
+            self._contract_cache = ContractCache(self._web3)
 
             self._gas_limit_multiplier = (
                 max(config.gas.gas_limit_multiplier, 1)
@@ -139,7 +175,7 @@ class CdpWalletProvider(EvmWalletProvider):
             raise Exception("Wallet not initialized")
 
         balance = self._wallet.balance("eth")
-        return Decimal(str(Web3.to_wei(balance, "ether")))
+        return Decimal(ether_to_wei(balance))
 
     def get_name(self) -> str:
         """Get the name of the wallet provider.
@@ -194,6 +230,57 @@ class CdpWalletProvider(EvmWalletProvider):
         except Exception as e:
             raise Exception(f"Failed to transfer native tokens: {e!s}") from e
 
+    def native_transfer_many(self, transfers: list[tuple[str, Decimal]]) -> list[str]:
+        """Transfer the native asset of the network to multiple destinations.
+
+        Every transfer is broadcast before waiting on any of them, so the confirmations overlap
+        instead of being awaited one after another.
+
+        Args:
+            transfers (list[tuple[str, Decimal]]): Pairs of destination address and amount to
+                transfer in whole units (e.g. 1.5 for 1.5 ETH)
+
+        Returns:
+            list[str]: The transaction hashes, in the same order as the transfers
+
+        Raises:
+            Exception: If wallet is not initialized
+            BatchTransferError: If any transfer fails, with the hashes of the transfers that were
+                already broadcast
+
+        """
+        if not self._wallet:
+            raise Exception("Wallet not initialized")
+
+        transfer_results = []
+        try:
+            for to, value in transfers:
+                transfer_results.append(
+                    self._wallet.transfer(
+                        amount=value,
+                        asset_id="eth",
+                        destination=Web3.to_checksum_address(to),
+                        gasless=False,
+                    )
+                )
+
+            tx_hashes = []
+            for transfer_result in transfer_results:
+                transfer_result.wait()
+                tx_hash = transfer_result.transaction_hash
+
+                if not tx_hash:
+                    raise Exception("Transaction hash not found")
+
+                tx_hashes.append(tx_hash)
+
+            return tx_hashes
+        except Exception as e:
+            raise BatchTransferError(
+                f"Failed to transfer native tokens: {e!s}",
+                [transfer_result.transaction_hash for transfer_result in transfer_results],
+            ) from e
+
     def read_contract(
         self,
         contract_address: ChecksumAddress,
@@ -218,7 +305,7 @@ class CdpWalletProvider(EvmWalletProvider):
             Exception: If the contract call fails or wallet is not initialized
 
         """
-        contract = self._web3.eth.contract(address=contract_address, abi=abi)
+        contract = self._contract_cache.get(contract_address, abi)
         func = contract.functions[function_name]
         if args is None:
             args = []
@@ -316,9 +403,7 @@ class CdpWalletProvider(EvmWalletProvider):
 
         signed_bytes = signed_dynamic_fee_tx.payload()
 
-        external_address = ExternalAddress(
-            self._wallet.network_id, self._wallet.default_address.address_id
-        )
+        external_address = ExternalAddress(self._network.network_id, self._address)
         broadcasted_transaction = external_address.broadcast_external_transaction(
             "02" + signed_bytes.hex()
         )
@@ -367,9 +452,9 @@ class CdpWalletProvider(EvmWalletProvider):
         transaction["from"] = self._address
         transaction["value"] = int(transaction.get("value", 0))
         transaction["type"] = 2
-        transaction["chainId"] = int(self._network.chain_id)
+        transaction["chainId"] = self._chain_id
 
-        nonce = self._web3.eth.get_transaction_count(self._address)
+        nonce, latest_block = self._get_nonce_and_latest_block()
         transaction["nonce"] = nonce
 
         data_field = transaction.get("data", b"")
@@ -378,7 +463,7 @@ class CdpWalletProvider(EvmWalletProvider):
 
         transaction["data"] = data_bytes
 
-        max_priority_fee_per_gas, max_fee_per_gas = self._estimate_fees()
+        max_priority_fee_per_gas, max_fee_per_gas = self._estimate_fees(latest_block)
         transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
         transaction["maxFeePerGas"] = max_fee_per_gas
 
@@ -389,17 +474,43 @@ class CdpWalletProvider(EvmWalletProvider):
 
         return transaction
 
-    def _estimate_fees(self):
+    def _get_nonce_and_latest_block(self) -> tuple[Nonce, BlockData]:
+        """Fetch the wallet's nonce and the latest block in a single batched JSON-RPC request.
+
+        Falls back to individual requests if the RPC endpoint rejects batch requests. Timeouts
+        and connection errors are raised rather than retried.
+
+        Returns:
+            tuple[Nonce, BlockData]: Tuple of (nonce, latest_block)
+
+        """
+        try:
+            with self._web3.batch_requests() as batch:
+                batch.add(self._web3.eth.get_transaction_count(self._address))
+                batch.add(self._web3.eth.get_block("latest"))
+                nonce, latest_block = batch.execute()
+        except RequestTimedOut:
+            raise
+        except (Web3RPCError, BadResponseFormat, Web3TypeError, HTTPError):
+            nonce = self._web3.eth.get_transaction_count(self._address)
+            latest_block = self._web3.eth.get_block("latest")
+
+        return nonce, latest_block
+
+    def _estimate_fees(self, latest_block: BlockData | None = None):
         """Estimate gas fees for a transaction, applying the configured fee multipliers.
 
+        Args:
+            latest_block (BlockData | None): The latest block, fetched if not provided
+
         Returns:
             tuple[int, int]: Tuple of (max_priority_fee_per_gas, max_fee_per_gas) in wei
 
         """
 
         def get_base_fee():
-            latest_block = self._web3.eth.get_block("latest")
-            base_fee = latest_block["baseFeePerGas"]
+            block = latest_block or self._web3.eth.get_block("latest")
+            base_fee = block["baseFeePerGas"]
             # Multiply the configured fee multiplier to give some buffer
             return int(base_fee * self._fee_per_gas_multiplier)
 
@@ -518,6 +629,81 @@ class CdpWalletProvider(EvmWalletProvider):
         except Exception as e:
             raise Exception(f"Failed to deploy token: {e!s}") from e
 
+    def deploy_token_and_distribute(
+        self,
+        name: str,
+        symbol: str,
+        total_supply: str,
+        distributions: list[tuple[str, str]],
+    ) -> tuple[Any, list[str]]:
+        """Deploy an ERC20 token contract and transfer initial allocations of it.
+
+        The distribution transfers are all broadcast once the deployment completes onchain, and
+        only then waited on, so their confirmations overlap instead of being awaited one after
+        another. Nothing is distributed if the deployment fails or does not confirm in time.
+
+        Args:
+            name (str): The name of the token
+            symbol (str): The symbol of the token
+            total_supply (str): The total supply of the token
+            distributions (list[tuple[str, str]]): Pairs of destination address and amount to
+                transfer in atomic units of the token
+
+        Returns:
+            tuple[Any, list[str]]: The deployed token contract instance and the distribution
+                transaction hashes, in the same order as the distributions
+
+        Raises:
+            Exception: If wallet is not initialized or deployment fails
+            BatchTransferError: If any transfer fails, with the hashes of the transfers that were
+                already broadcast
+
+        """
+        if not self._wallet:
+            raise Exception("Wallet not initialized")
+
+        try:
+            token_contract = self._wallet.deploy_token(
+                name=name,
+                symbol=symbol,
+                total_supply=total_supply,
+            ).wait(interval_seconds=0.2, timeout_seconds=60)
+
+            status = token_contract.transaction.status if token_contract.transaction else None
+            if status != Transaction.Status.COMPLETE:
+                raise Exception(f"Deployment did not complete with status: {status}")
+        except Exception as e:
+            raise Exception(f"Failed to deploy token: {e!s}") from e
+
+        invocations = []
+        try:
+            for to, amount in distributions:
+                invocations.append(
+                    self._wallet.invoke_contract(
+                        contract_address=token_contract.contract_address,
+                        method="transfer",
+                        abi=ERC20_TRANSFER_ABI,
+                        args={"recipient": Web3.to_checksum_address(to), "amount": str(amount)},
+                    )
+                )
+
+            tx_hashes = []
+            for invocation in invocations:
+                invocation.wait()
+                tx_hash = invocation.transaction_hash
+
+                if not tx_hash:
+                    raise Exception("Transaction hash not found")
+
+                tx_hashes.append(tx_hash)
+
+            return token_contract, tx_hashes
+        except Exception as e:
+            raise BatchTransferError(
+                f"Failed to distribute token: {e!s}",
+                [invocation.transaction_hash for invocation in invocations],
+            ) from e
+
     def trade(self, amount: str, from_asset_id: str, to_asset_id: str) -> str:
         """Trade a specified amount of one asset for another.
 
@@ -542,13 +728,12 @@ class CdpWalletProvider(EvmWalletProvider):
                 from_asset_id=from_asset_id,
                 to_asset_id=to_asset_id,
             ).wait()
+            transaction = trade_result.transaction
 
-            return "\n".join(
-                [
-                    f"Traded {amount} of {from_asset_id} for {trade_result.to_amount} of {to_asset_id}.",
-                    f"Transaction hash for the trade: {trade_result.transaction.transaction_hash}",
-                    f"Transaction link for the trade: {trade_result.transaction.transaction_link}",
-                ]
+            return (
+                f"Traded {amount} of {from_asset_id} for {trade_result.to_amount} of {to_asset_id}.\n"
+                f"Transaction hash for the trade: {transaction.transaction_hash}\n"
+                f"Transaction link for the trade: {transaction.transaction_link}"
             )
         except Exception as e:
             raise Exception(f"Error trading assets: {e!s}") from e
@@ -1,14 +1,37 @@
 """Base class for EVM-compatible wallet providers."""
 
+import threading
 from abc import ABC, abstractmethod
+from decimal import Context, Decimal, Inexact
+from functools import lru_cache
 from typing import Any
 
+import requests
+from cdp import Cdp
 from eth_account.datastructures import SignedTransaction
 from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from web3 import Web3
+from web3.contract import Contract
 from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
 
+from ..__version__ import __version__
 from .wallet_provider import WalletProvider
 
+# (connect, read) timeouts in seconds for JSON-RPC requests
+RPC_REQUEST_TIMEOUT = (3.05, 30)
+
+# Maximum number of contract instances a wallet provider keeps for repeated read_contract calls
+CONTRACT_CACHE_SIZE = 128
+
+# Largest amount of wei representable as a uint256
+MAX_WEI = 2**256 - 1
+
+# Enough precision to scale any uint256 amount of ether to wei; amounts with more significant
+# digits would be rounded, so they raise Inexact instead
+_WEI_CONTEXT = Context(prec=100, traps=[Inexact])
+
 
 class EvmGasConfig(BaseModel):
     """Configuration for gas multipliers."""
@@ -21,6 +44,158 @@ class EvmGasConfig(BaseModel):
     )
 
 
+class ContractCache:
+    """A bounded cache of contract instances keyed by contract address and ABI object.
+
+    Action providers pass module-level ABI constants, so keying on the ABI's identity lets
+    repeated reads skip parsing the ABI. Each entry keeps a reference to its ABI so the id cannot
+    be reused by another object while it is cached, and the oldest entry is evicted once the
+    cache is full. Lookups and insertions are guarded by a lock, so one cache can be shared by
+    threads using the same provider.
+    """
+
+    def __init__(self, web3: Web3, maxsize: int = CONTRACT_CACHE_SIZE):
+        """Initialize the cache.
+
+        Args:
+            web3 (Web3): The client used to build contract instances
+            maxsize (int): The maximum number of contract instances to keep
+
+        """
+        self._web3 = web3
+        self._maxsize = maxsize
+        self._contracts: dict[
+            tuple[ChecksumAddress, int], tuple[list[dict[str, Any]], Contract]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def get(self, contract_address: ChecksumAddress, abi: list[dict[str, Any]]) -> Contract:
+        """Get a contract instance, reusing the one built for the same address and ABI object.
+
+        Args:
+            contract_address (ChecksumAddress): The address of the contract
+            abi (list[dict[str, Any]]): The ABI of the contract
+
+        Returns:
+            Contract: The contract instance
+
+        """
+        key = (contract_address, id(abi))
+        with self._lock:
+            cached = self._contracts.get(key)
+        if cached is not None:
+            return cached[1]
+
+        contract = self._web3.eth.contract(address=contract_address, abi=abi)
+        with self._lock:
+            # Another thread may have cached the same contract while this one was building it
+            cached = self._contracts.get(key)
+            if cached is not None:
+                return cached[1]
+
+            if len(self._contracts) >= self._maxsize:
+                del self._contracts[next(iter(self._contracts))]
+            self._contracts[key] = (abi, contract)
+
+        return contract
+
+
+def configure_cdp(api_key_name: str | None, api_key_private_key: str | None) -> None:
+    """Configure the CDP SDK with the given API key, or from the JSON key file if none is given.
+
+    Cdp.configure replaces the SDK's API client (and its connection pool), so the SDK is only
+    reconfigured when the credentials differ from the ones already in use.
+
+    Args:
+        api_key_name (str | None): The CDP API key name
+        api_key_private_key (str | None): The CDP API private key
+
+    """
+    if api_key_name and api_key_private_key:
+        private_key = api_key_private_key.replace("\\n", "\n")
+
+        if Cdp.api_key_name != api_key_name or Cdp.private_key != private_key:
+            Cdp.configure(
+                api_key_name=api_key_name,
+                private_key=private_key,
+                source="agentkit",
+                source_version=__version__,
+            )
+    else:
+        Cdp.configure_from_json(source="agentkit", source_version=__version__)
+
+
+def create_rpc_session() -> requests.Session:
+    """Create a requests session that keeps a pool of connections alive to JSON-RPC endpoints.
+
+    Returns:
+        requests.Session: A session with pooled HTTP(S) adapters and connection retries
+
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.1),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def ether_to_wei(value: Decimal | int | float | str) -> int:
+    """Convert an amount of ether to wei.
+
+    Non-negative Decimal amounts that can be scaled exactly are converted directly; anything
+    else goes through Web3.to_wei.
+
+    Args:
+        value (Decimal | int | float | str): The amount in whole units of ether
+
+    Returns:
+        int: The amount in wei
+
+    Raises:
+        ValueError: If the amount is not a valid wei value
+
+    """
+    if isinstance(value, Decimal) and value.is_finite() and value >= 0:
+        try:
+            wei = int(value.scaleb(18, _WEI_CONTEXT))
+        except Inexact:
+            pass
+        else:
+            if wei <= MAX_WEI:
+                return wei
+
+    return Web3.to_wei(value, "ether")
+
+
+@lru_cache(maxsize=32)
+def get_web3(rpc_url: str) -> Web3:
+    """Get a Web3 client for a JSON-RPC endpoint.
+
+    Clients are cached per URL, so wallet providers created for the same network share one
+    connection pool instead of setting up a new provider and session each time. Sharing a client
+    across threads relies on web3 7.15+, which scopes batch_requests() to the calling context and
+    sends requests from every thread through the given session.
+
+    Args:
+        rpc_url (str): The JSON-RPC endpoint URL
+
+    Returns:
+        Web3: A Web3 client using a pooled session and request timeouts
+
+    """
+    return Web3(
+        Web3.HTTPProvider(
+            rpc_url,
+            request_kwargs={"timeout": RPC_REQUEST_TIMEOUT},
+            session=create_rpc_session(),
+        )
+    )
+
+
 class EvmWalletProvider(WalletProvider, ABC):
     """Abstract base class for all EVM wallet providers."""
 
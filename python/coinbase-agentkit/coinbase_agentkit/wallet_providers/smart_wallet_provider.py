@@ -1,17 +1,57 @@
+import time
 from decimal import Decimal
 from typing import Any
 
-from cdp import Cdp, EncodedCall, SmartWallet, UserOperation, to_smart_wallet
+from cdp import EncodedCall, SmartWallet, UserOperation, to_smart_wallet
 from cdp.evm_call_types import ContractCall
 from eth_account.account import LocalAccount
 from eth_account.datastructures import SignedTransaction
 from pydantic import BaseModel, Field
-from web3 import Web3
 from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
 
-from ..__version__ import __version__
-from ..network import NETWORK_ID_TO_CHAIN, Network
-from .evm_wallet_provider import EvmWalletProvider
+from ..network import NETWORK_ID_TO_CHAIN_INFO, Network
+from .evm_wallet_provider import (
+    ContractCache,
+    EvmWalletProvider,
+    configure_cdp,
+    ether_to_wei,
+    get_web3,
+)
+
+# Seconds a fetched balance is reused before get_balance queries the RPC again
+BALANCE_CACHE_TTL = 1.0
+
+# Multicall3 is deployed at the same address on every supported network
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "type": "function",
+        "name": "aggregate3",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+            }
+        ],
+    }
+]
 
 
 class SmartWalletProviderConfig(BaseModel):
@@ -37,25 +77,22 @@ class SmartWalletProvider(EvmWalletProvider):
 
     def __init__(self, config: SmartWalletProviderConfig):
         """Initialize the SmartWalletProvider."""
+        chain_info = NETWORK_ID_TO_CHAIN_INFO.get(config.network_id)
+        if chain_info is None:
+            raise KeyError(
+                f"Unsupported network: {config.network_id}. "
+                f"Supported networks: {', '.join(NETWORK_ID_TO_CHAIN_INFO)}"
+            )
+
         self._network_id = config.network_id
         self._network = Network(
             protocol_family="evm",
             network_id=config.network_id,
-            chain_id=NETWORK_ID_TO_CHAIN[config.network_id].id,
-        )
-        self._web3 = Web3(
-            Web3.HTTPProvider(NETWORK_ID_TO_CHAIN[config.network_id].rpc_urls["default"].http[0])
+            chain_id=chain_info.id,
         )
+        self._web3 = get_web3(chain_info.rpc_url)
 
-        if config.cdp_api_key_name and config.cdp_api_key_private_key:
-            Cdp.configure(
-                api_key_name=config.cdp_api_key_name,
-                private_key=config.cdp_api_key_private_key.replace("\\n", "\n"),
-                source="agentkit",
-                source_version=__version__,
-            )
-        else:
-            Cdp.configure_from_json(source="agentkit", source_version=__version__)
+        configure_cdp(config.cdp_api_key_name, config.cdp_api_key_private_key)
 
         if config.smart_wallet_address:
             self._smart_wallet = to_smart_wallet(
@@ -69,6 +106,9 @@ class SmartWalletProvider(EvmWalletProvider):
             paymaster_url=config.paymaster_url,
         )
 
+        self._balance_cache: tuple[float, Decimal] | None = None
+        self._contract_cache = ContractCache(self._web3)
+
     def get_address(self) -> str:
         """Get the smart wallet address."""
         return self._smart_wallet.address
@@ -115,20 +155,26 @@ class SmartWalletProvider(EvmWalletProvider):
         instead of directly broadcasting a transaction. The smart wallet handles execution,
         but a standard transaction hash is still returned upon completion.
         """
-        user_operation = self._smart_wallet.send_user_operation(
-            calls=[
-                EncodedCall(
-                    to=transaction["to"],
-                    data=transaction.get("data", b""),
-                    value=transaction.get("value", 0),
-                ),
-            ]
+        return self._send_calls([self._to_encoded_call(transaction)], "Transaction failed")
+
+    def send_transactions(self, transactions: list[TxParams]) -> HexStr:
+        """Send several transactions as a single user operation.
+
+        The calls are bundled and executed atomically, so they cost one bundler submission and
+        one confirmation wait instead of one of each per transaction.
+        """
+        return self.send_user_operation(
+            calls=[self._to_encoded_call(transaction) for transaction in transactions]
+        )
+
+    @staticmethod
+    def _to_encoded_call(transaction: TxParams) -> EncodedCall:
+        """Convert a transaction into a call for a user operation."""
+        return EncodedCall(
+            to=transaction["to"],
+            data=transaction.get("data", b""),
+            value=transaction.get("value", 0),
         )
-        result = user_operation.wait()
-        if result.status == UserOperation.Status.COMPLETE:
-            return result.transaction_hash
-        else:
-            raise Exception("Transaction failed")
 
     def send_user_operation(
         self,
@@ -140,12 +186,24 @@ class SmartWalletProvider(EvmWalletProvider):
         SmartWallet-aware tools to fully leverage its capabilities, including batching multiple calls.
         Unlike send_transaction, which wraps calls in a single operation, this method allows
         direct execution of arbitrary operations within a User Operation.
+        """
+        return self._send_calls(calls, "Operation failed")
+
+    def _send_calls(
+        self, calls: list[ContractCall], failure_message: str, **wait_kwargs: Any
+    ) -> HexStr:
+        """Send calls as a user operation and wait for it to complete.
+
+        Raises:
+            Exception: With the failure message and final status if the operation did not complete.
+
         """
         user_operation = self._smart_wallet.send_user_operation(calls=calls)
-        result = user_operation.wait()
+        result = user_operation.wait(**wait_kwargs)
+        self._balance_cache = None
         if result.status == UserOperation.Status.COMPLETE:
             return result.transaction_hash
-        raise Exception(f"Operation failed with status: {result.status}")
+        raise Exception(f"{failure_message} with status: {result.status}")
 
     def wait_for_transaction_receipt(
         self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
@@ -164,25 +222,63 @@ class SmartWalletProvider(EvmWalletProvider):
         block_identifier: BlockIdentifier = "latest",
     ) -> Any:
         """Read data from a smart contract."""
-        contract = self._web3.eth.contract(address=contract_address, abi=abi)
+        contract = self._contract_cache.get(contract_address, abi)
         func = contract.functions[function_name]
         return func(*(args or [])).call(block_identifier=block_identifier)
 
+    def read_contract_batch(
+        self,
+        calls: list[tuple[ChecksumAddress, list[dict[str, Any]], str, list[Any] | None]],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[Any]:
+        """Read data from several smart contract functions in a single JSON-RPC batch request.
+
+        Each call is a (contract_address, abi, function_name, args) tuple, and the results are
+        returned in the same order as the calls.
+        """
+        with self._web3.batch_requests() as batch:
+            for contract_address, abi, function_name, args in calls:
+                func = self._contract_cache.get(contract_address, abi).functions[function_name]
+                batch.add(func(*(args or [])).call(block_identifier=block_identifier))
+
+            return batch.execute()
+
+    def multicall(
+        self,
+        calls: list[tuple[ChecksumAddress, HexStr | bytes]],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[bytes]:
+        """Execute several read-only calls in a single eth_call through Multicall3.
+
+        Each call is a (target, calldata) pair. The raw return data is returned in the same order
+        as the calls, and the whole read reverts if any call reverts.
+        """
+        multicall3 = self._contract_cache.get(MULTICALL3_ADDRESS, MULTICALL3_ABI)
+        results = multicall3.functions["aggregate3"](
+            [(target, False, call_data) for target, call_data in calls]
+        ).call(block_identifier=block_identifier)
+        return [return_data for _, return_data in results]
+
     def get_balance(self) -> Decimal:
-        """Get the balance of the smart wallet."""
-        balance = self._web3.eth.get_balance(self.get_address())
-        return Decimal(balance)
+        """Get the balance of the smart wallet.
+
+        Balances are reused for BALANCE_CACHE_TTL seconds, and refreshed after any user
+        operation this provider sends.
+        """
+        now = time.monotonic()
+        if self._balance_cache is not None and now - self._balance_cache[0] < BALANCE_CACHE_TTL:
+            return self._balance_cache[1]
+
+        balance = Decimal(self._web3.eth.get_balance(self.get_address()))
+        self._balance_cache = (now, balance)
+        return balance
 
     def native_transfer(self, to: str, value: Decimal) -> HexStr:
         """Transfer native assets using the smart wallet."""
-        value_wei = Web3.to_wei(value, "ether")
-        user_operation = self._smart_wallet.send_user_operation(
-            calls=[
-                EncodedCall(to=to, value=value_wei, data="0x"),
-            ]
+        value_wei = ether_to_wei(value)
+        return self._send_calls(
+            [EncodedCall(to=to, value=value_wei, data="0x")],
+            "Transaction failed",
+            interval_seconds=0.2,
+            timeout_seconds=20,
         )
-        result = user_operation.wait(interval_seconds=0.2, timeout_seconds=20)
-        if result.status == UserOperation.Status.COMPLETE:
-            return result.transaction_hash
-        else:
-            raise Exception("Transaction failed")
@@ -1,7 +1,8 @@
 """Tests for Allora action provider."""
 
+import asyncio
 import json
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from allora_sdk.v2.api_client import (
@@ -10,7 +11,10 @@ from allora_sdk.v2.api_client import (
 )
 from pydantic import ValidationError
 
-from coinbase_agentkit.action_providers.allora.allora_action_provider import AlloraActionProvider
+from coinbase_agentkit.action_providers.allora.allora_action_provider import (
+    AlloraActionProvider,
+    _EventLoopThread,
+)
 from coinbase_agentkit.action_providers.allora.schemas import (
     GetAllTopicsInput,
     GetInferenceByTopicIdInput,
@@ -213,3 +217,39 @@ def test_run_async_method(provider):
     # Test that _run_async correctly runs the coroutine
     result = provider._run_async(mock_coro())
     assert result == "test_result"
+
+
+def test_run_async_reuses_event_loop(provider):
+    """Test that _run_async runs every coroutine on the same persistent event loop."""
+
+    async def get_loop():
+        return asyncio.get_running_loop()
+
+    provider._run_async = AlloraActionProvider._run_async.__get__(provider, AlloraActionProvider)
+
+    first_loop = provider._run_async(get_loop())
+    second_loop = provider._run_async(get_loop())
+
+    assert first_loop is second_loop
+    assert first_loop.is_running()
+
+
+def test_event_loop_thread_uses_uvloop_when_available():
+    """Test that the background event loop is created with uvloop when it is installed."""
+
+    async def get_loop():
+        return asyncio.get_running_loop()
+
+    mock_uvloop = MagicMock()
+    mock_uvloop.new_event_loop.side_effect = asyncio.new_event_loop
+    loop_thread = _EventLoopThread()
+
+    with patch(
+        "coinbase_agentkit.action_providers.allora.allora_action_provider.uvloop", mock_uvloop
+    ):
+        loop = loop_thread.run(get_loop())
+
+    loop_thread.stop()
+
+    mock_uvloop.new_event_loop.assert_called_once_with()
+    assert loop.is_closed()
@@ -78,6 +78,25 @@ def test_request_usdc(mock_wallet_testnet_provider, mock_transaction, mock_env,
     assert response == expected_response
 
 
+def test_request_faucet_funds_with_validated_args(
+    mock_wallet_testnet_provider, mock_transaction, mock_env, mock_cdp_imports
+):
+    """Test requesting faucet funds with an already validated schema instance."""
+    _, mock_external_address = mock_cdp_imports
+
+    mock_external_address.return_value.faucet.return_value = mock_transaction
+
+    response = cdp_api_action_provider().request_faucet_funds(
+        mock_wallet_testnet_provider, RequestFaucetFundsSchema(asset_id="usdc")
+    )
+
+    mock_external_address.return_value.faucet.assert_called_once_with("usdc")
+    expected_response = (
+        f"Received usdc from the faucet. Transaction: {MOCK_EXPLORER_URL}/{MOCK_TX_HASH}"
+    )
+    assert response == expected_response
+
+
 def test_request_faucet_wrong_network(mock_env):
     """Test faucet request fails on wrong network (mainnet)."""
     with patch("cdp.Cdp"):
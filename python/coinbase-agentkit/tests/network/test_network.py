@@ -0,0 +1,26 @@
+"""Tests for the network mappings."""
+
+import pytest
+
+from coinbase_agentkit.network import (
+    NETWORK_ID_TO_CHAIN,
+    NETWORK_ID_TO_CHAIN_ID,
+    NETWORK_ID_TO_CHAIN_INFO,
+    ChainInfo,
+)
+
+
+def test_chain_info_covers_every_network():
+    """Test that every network with a chain definition has chain info."""
+    assert NETWORK_ID_TO_CHAIN_INFO.keys() == NETWORK_ID_TO_CHAIN.keys()
+
+
+@pytest.mark.parametrize("network_id", NETWORK_ID_TO_CHAIN)
+def test_chain_info_matches_chain(network_id):
+    """Test that the chain info holds the chain's ID and default JSON-RPC URL."""
+    chain = NETWORK_ID_TO_CHAIN[network_id]
+
+    assert NETWORK_ID_TO_CHAIN_INFO[network_id] == ChainInfo(
+        id=chain.id, rpc_url=chain.rpc_urls["default"].http[0]
+    )
+    assert NETWORK_ID_TO_CHAIN_INFO[network_id].id == NETWORK_ID_TO_CHAIN_ID[network_id]
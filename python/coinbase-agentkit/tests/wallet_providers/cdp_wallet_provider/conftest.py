@@ -1,9 +1,9 @@
 """Common test fixtures for CDP Wallet Provider tests."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
-from cdp import Wallet
+from cdp import Transaction, Wallet
 
 from coinbase_agentkit.wallet_providers.cdp_wallet_provider import (
     CdpWalletProvider,
@@ -53,7 +53,7 @@ MOCK_SIGNATURE = "0x123456"
 @pytest.fixture
 def mock_cdp():
     """Create a mock for CDP SDK."""
-    with patch("coinbase_agentkit.wallet_providers.cdp_wallet_provider.Cdp") as mock_cdp:
+    with patch("coinbase_agentkit.wallet_providers.evm_wallet_provider.Cdp") as mock_cdp:
         yield mock_cdp
 
 
@@ -77,6 +77,9 @@ def mock_wallet():
     mock.deploy_contract.return_value = Mock()
     mock.deploy_nft.return_value = Mock()
     mock.deploy_token.return_value = Mock()
+    mock.deploy_token.return_value.wait.return_value.transaction.status = (
+        Transaction.Status.COMPLETE
+    )
 
     trade_result = Mock()
     trade_result.to_amount = "0.5"
@@ -92,13 +95,24 @@ def mock_wallet():
 @pytest.fixture
 def mock_web3():
     """Create a mock Web3 instance."""
-    with patch("coinbase_agentkit.wallet_providers.cdp_wallet_provider.Web3") as mock_web3:
+    with (
+        patch("coinbase_agentkit.wallet_providers.cdp_wallet_provider.Web3") as mock_web3,
+        patch("coinbase_agentkit.wallet_providers.cdp_wallet_provider.get_web3") as mock_get_web3,
+    ):
         mock_web3_instance = Mock()
         mock_web3.return_value = mock_web3_instance
+        mock_get_web3.return_value = mock_web3_instance
 
         mock_block = {"baseFeePerGas": MOCK_BASE_FEE_PER_GAS}
         mock_web3_instance.eth.get_block.return_value = mock_block
 
+        mock_batch = MagicMock()
+        mock_batch.__enter__.return_value = mock_batch
+        mock_batch.execute.side_effect = lambda: [
+            added.args[0] for added in mock_batch.add.call_args_list
+        ]
+        mock_web3_instance.batch_requests.return_value = mock_batch
+
         mock_web3_instance.eth.estimate_gas.return_value = MOCK_GAS_LIMIT
 
         mock_receipt = {"transactionHash": bytes.fromhex(MOCK_TRANSACTION_HASH[2:])}
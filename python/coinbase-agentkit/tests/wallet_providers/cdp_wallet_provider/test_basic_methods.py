@@ -33,6 +33,13 @@ def test_get_balance(mocked_wallet_provider, mock_wallet):
         provider_wallet.balance.assert_called_once_with("eth")
 
 
+def test_get_balance_with_decimal_balance(mocked_wallet_provider):
+    """Test get_balance converts a Decimal balance to wei exactly."""
+    mocked_wallet_provider._wallet.balance.return_value = Decimal("1.000000000000000001")
+
+    assert mocked_wallet_provider.get_balance() == Decimal(MOCK_ONE_ETH_WEI + 1)
+
+
 def test_get_balance_without_wallet(mocked_wallet_provider):
     """Test get_balance method when wallet is not initialized."""
     mocked_wallet_provider._wallet = None
@@ -30,6 +30,16 @@ def test_read_contract(mocked_wallet_provider, mock_web3):
     mock_web3.return_value.eth.contract.assert_called_once_with(address=contract_address, abi=abi)
 
 
+def test_read_contract_reuses_contract(mocked_wallet_provider, mock_web3):
+    """Test read_contract reuses the cached contract for the same address and ABI."""
+    abi = [{"name": "testFunction", "type": "function", "inputs": [], "outputs": []}]
+
+    mocked_wallet_provider.read_contract(MOCK_ADDRESS_TO, abi, "testFunction")
+    mocked_wallet_provider.read_contract(MOCK_ADDRESS_TO, abi, "testFunction")
+
+    mock_web3.return_value.eth.contract.assert_called_once_with(address=MOCK_ADDRESS_TO, abi=abi)
+
+
 def test_read_contract_error(mocked_wallet_provider, mock_web3):
     """Test read_contract method when contract call fails."""
     contract_address = MOCK_ADDRESS_TO
@@ -7,6 +7,7 @@ from unittest.mock import ANY, Mock, patch
 import pytest
 from cdp import Wallet
 
+from coinbase_agentkit.network import ChainInfo
 from coinbase_agentkit.wallet_providers.cdp_wallet_provider import (
     CdpWalletProvider,
     CdpWalletProviderConfig,
@@ -78,12 +79,8 @@ def test_init_with_api_keys(mock_cdp, mock_wallet):
         patch("coinbase_agentkit.wallet_providers.cdp_wallet_provider.Wallet") as mock_wallet_class,
         patch("os.getenv", return_value=None),
         patch(
-            "coinbase_agentkit.wallet_providers.cdp_wallet_provider.NETWORK_ID_TO_CHAIN",
-            {
-                "base-sepolia": Mock(
-                    id="84532", rpc_urls={"default": Mock(http=["https://sepolia.base.org"])}
-                )
-            },
+            "coinbase_agentkit.wallet_providers.cdp_wallet_provider.NETWORK_ID_TO_CHAIN_INFO",
+            {"base-sepolia": ChainInfo(id="84532", rpc_url="https://sepolia.base.org")},
         ),
     ):
         mock_wallet_class.create.return_value = mock_wallet
@@ -106,6 +103,22 @@ def test_init_with_api_keys(mock_cdp, mock_wallet):
         assert provider.get_address() == MOCK_ADDRESS
 
 
+def test_init_uses_shared_web3_client(mock_cdp, mock_wallet):
+    """Test initialization reuses the cached Web3 client for the network's RPC URL."""
+    with (
+        patch("coinbase_agentkit.wallet_providers.cdp_wallet_provider.Wallet") as mock_wallet_class,
+        patch("coinbase_agentkit.wallet_providers.cdp_wallet_provider.get_web3") as mock_get_web3,
+    ):
+        mock_wallet_class.create.return_value = mock_wallet
+
+        first = CdpWalletProvider(CdpWalletProviderConfig(network_id=MOCK_NETWORK_ID))
+        second = CdpWalletProvider(CdpWalletProviderConfig(network_id=MOCK_NETWORK_ID))
+
+        mock_get_web3.assert_called_with("https://sepolia.base.org")
+        assert first._web3 is mock_get_web3.return_value
+        assert second._web3 is mock_get_web3.return_value
+
+
 def test_init_without_config(mock_cdp, mock_wallet):
     """Test initialization without config (should use environment variables)."""
     with (
@@ -142,12 +155,8 @@ def test_init_with_default_network(mock_cdp, mock_wallet):
         ),
         patch.dict(os.environ, {}, clear=True),
         patch(
-            "coinbase_agentkit.wallet_providers.cdp_wallet_provider.NETWORK_ID_TO_CHAIN",
-            {
-                "base-sepolia": Mock(
-                    id="84532", rpc_urls={"default": Mock(http=["https://sepolia.base.org"])}
-                )
-            },
+            "coinbase_agentkit.wallet_providers.cdp_wallet_provider.NETWORK_ID_TO_CHAIN_INFO",
+            {"base-sepolia": ChainInfo(id="84532", rpc_url="https://sepolia.base.org")},
         ),
     ):
         mock_wallet = Mock(spec=Wallet)
@@ -168,7 +177,7 @@ def test_init_with_default_network(mock_cdp, mock_wallet):
 
 def test_import_error(mock_cdp):
     """Test handling of import error."""
-    with patch("coinbase_agentkit.wallet_providers.cdp_wallet_provider.Cdp") as cdp_mock:
+    with patch("coinbase_agentkit.wallet_providers.evm_wallet_provider.Cdp") as cdp_mock:
         error_msg = "Failed to import cdp"
         cdp_mock.configure.side_effect = ImportError(error_msg)
         cdp_mock.configure_from_json.side_effect = ImportError(error_msg)
@@ -1,6 +1,16 @@
 """Tests for CDP Wallet Provider token and contract deployment operations."""
 
+from unittest.mock import Mock
+
 import pytest
+from cdp import Transaction
+
+from coinbase_agentkit.wallet_providers.cdp_wallet_provider import (
+    ERC20_TRANSFER_ABI,
+    BatchTransferError,
+)
+
+from .conftest import MOCK_ADDRESS, MOCK_ADDRESS_TO, MOCK_TRANSACTION_HASH
 
 # =========================================================
 # token & contract deployment operations
@@ -96,3 +106,108 @@ def test_deploy_token_failure(mocked_wallet_provider, mock_wallet):
 
     with pytest.raises(Exception, match="Failed to deploy token"):
         mocked_wallet_provider.deploy_token("Test", "TEST", "1000000")
+
+
+def test_deploy_token_and_distribute(mocked_wallet_provider, mock_wallet):
+    """Test deploy_token_and_distribute broadcasts every transfer before waiting on any."""
+    calls = []
+    token_contract = Mock(contract_address="0xTokenContract")
+    token_contract.transaction.status = Transaction.Status.COMPLETE
+    mock_wallet.deploy_token.return_value.wait.return_value = token_contract
+
+    def record_invoke(**_kwargs):
+        calls.append("invoke")
+        invocation = Mock(transaction_hash=MOCK_TRANSACTION_HASH)
+        invocation.wait.side_effect = lambda: calls.append("wait")
+        return invocation
+
+    mock_wallet.invoke_contract.side_effect = record_invoke
+
+    contract, tx_hashes = mocked_wallet_provider.deploy_token_and_distribute(
+        "Test Token", "TT", "1000000", [(MOCK_ADDRESS_TO, "100"), (MOCK_ADDRESS_TO, "200")]
+    )
+
+    assert contract is token_contract
+    assert tx_hashes == [MOCK_TRANSACTION_HASH, MOCK_TRANSACTION_HASH]
+    assert calls == ["invoke", "invoke", "wait", "wait"]
+    mock_wallet.deploy_token.assert_called_once_with(
+        name="Test Token", symbol="TT", total_supply="1000000"
+    )
+    mock_wallet.deploy_token.return_value.wait.assert_called_once_with(
+        interval_seconds=0.2, timeout_seconds=60
+    )
+    mock_wallet.invoke_contract.assert_any_call(
+        contract_address="0xTokenContract",
+        method="transfer",
+        abi=ERC20_TRANSFER_ABI,
+        args={"recipient": MOCK_ADDRESS, "amount": "200"},
+    )
+
+
+def test_deploy_token_and_distribute_without_wallet(mocked_wallet_provider):
+    """Test deploy_token_and_distribute method when wallet is not initialized."""
+    mocked_wallet_provider._wallet = None
+    with pytest.raises(Exception, match="Wallet not initialized"):
+        mocked_wallet_provider.deploy_token_and_distribute("Test", "TEST", "1000000", [])
+
+
+def test_deploy_token_and_distribute_deploy_failure(mocked_wallet_provider, mock_wallet):
+    """Test deploy_token_and_distribute skips the transfers when deployment fails."""
+    mock_wallet.deploy_token.side_effect = Exception("Token deployment failed")
+
+    with pytest.raises(Exception, match="Failed to deploy token"):
+        mocked_wallet_provider.deploy_token_and_distribute(
+            "Test", "TEST", "1000000", [(MOCK_ADDRESS_TO, "100")]
+        )
+
+    mock_wallet.invoke_contract.assert_not_called()
+
+
+@pytest.mark.parametrize("status", [Transaction.Status.FAILED, Transaction.Status.BROADCAST])
+def test_deploy_token_and_distribute_incomplete_deploy(mocked_wallet_provider, mock_wallet, status):
+    """Test deploy_token_and_distribute skips the transfers when deployment did not complete."""
+    mock_wallet.deploy_token.return_value.wait.return_value.transaction.status = status
+
+    with pytest.raises(Exception, match=f"Failed to deploy token: .*status: {status}"):
+        mocked_wallet_provider.deploy_token_and_distribute(
+            "Test", "TEST", "1000000", [(MOCK_ADDRESS_TO, "100")]
+        )
+
+    mock_wallet.invoke_contract.assert_not_called()
+
+
+def test_deploy_token_and_distribute_deploy_timeout(mocked_wallet_provider, mock_wallet):
+    """Test deploy_token_and_distribute skips the transfers when deployment times out."""
+    mock_wallet.deploy_token.return_value.wait.side_effect = TimeoutError(
+        "SmartContract deployment timed out"
+    )
+
+    with pytest.raises(Exception, match="Failed to deploy token: .*timed out"):
+        mocked_wallet_provider.deploy_token_and_distribute(
+            "Test", "TEST", "1000000", [(MOCK_ADDRESS_TO, "100")]
+        )
+
+    mock_wallet.invoke_contract.assert_not_called()
+
+
+def test_deploy_token_and_distribute_transfer_failure(mocked_wallet_provider, mock_wallet):
+    """Test deploy_token_and_distribute method when a transfer fails."""
+    mock_wallet.invoke_contract.side_effect = Exception("Invocation failed")
+
+    with pytest.raises(Exception, match="Failed to distribute token"):
+        mocked_wallet_provider.deploy_token_and_distribute(
+            "Test", "TEST", "1000000", [(MOCK_ADDRESS_TO, "100")]
+        )
+
+
+def test_deploy_token_and_distribute_partial_transfer_failure(mocked_wallet_provider, mock_wallet):
+    """Test deploy_token_and_distribute reports the hashes of transfers sent before one fails."""
+    sent = Mock(transaction_hash="0xsent")
+    mock_wallet.invoke_contract.side_effect = [sent, Exception("Invocation failed")]
+
+    with pytest.raises(BatchTransferError, match="Failed to distribute token") as exc_info:
+        mocked_wallet_provider.deploy_token_and_distribute(
+            "Test", "TEST", "1000000", [(MOCK_ADDRESS_TO, "100"), (MOCK_ADDRESS_TO, "200")]
+        )
+
+    assert exc_info.value.tx_hashes == ["0xsent"]
@@ -1,13 +1,26 @@
 """Tests for CDP Wallet Provider transaction operations."""
 
 from decimal import Decimal
-from unittest.mock import Mock, call, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
+import requests
+from web3.exceptions import (
+    BadResponseFormat,
+    MethodUnavailable,
+    RequestTimedOut,
+    Web3RPCError,
+    Web3TypeError,
+)
+
+from coinbase_agentkit.wallet_providers.cdp_wallet_provider import BatchTransferError
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import get_web3
 
+from ..conftest import MOCK_RPC_BLOCK, MOCK_RPC_TRANSACTION_COUNT, call_during_batch
 from .conftest import (
     MOCK_ADDRESS,
     MOCK_ADDRESS_TO,
+    MOCK_BASE_FEE_PER_GAS,
     MOCK_NETWORK_ID,
     MOCK_ONE_ETH_WEI,
     MOCK_TRANSACTION_HASH,
@@ -146,6 +159,93 @@ def test_send_transaction_timeout(mocked_wallet_provider):
             mocked_wallet_provider.send_transaction(transaction)
 
 
+def test_prepare_transaction_batches_nonce_and_latest_block(mocked_wallet_provider, mock_web3):
+    """Test that the nonce and latest block are fetched in a single batched request."""
+    mock_web3_instance = mock_web3.return_value
+    batch = MagicMock()
+    batch.__enter__.return_value = batch
+    batch.execute.return_value = [7, {"baseFeePerGas": MOCK_BASE_FEE_PER_GAS}]
+    mock_web3_instance.batch_requests.return_value = batch
+
+    transaction = mocked_wallet_provider._prepare_transaction(
+        {"to": MOCK_ADDRESS_TO, "value": MOCK_ONE_ETH_WEI, "data": "0x"}
+    )
+
+    assert batch.add.call_count == 2
+    batch.execute.assert_called_once()
+    mock_web3_instance.eth.get_block.assert_called_once_with("latest")
+    assert transaction["nonce"] == 7
+    assert transaction["maxFeePerGas"] > transaction["maxPriorityFeePerGas"]
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        Web3RPCError("Batch requests not supported"),
+        MethodUnavailable("Method not found"),
+        BadResponseFormat("Unexpected batch response"),
+        Web3TypeError("Batch requests are not supported by this provider."),
+        requests.HTTPError("405 Client Error: Method Not Allowed"),
+    ],
+)
+def test_prepare_transaction_without_batch_support(mocked_wallet_provider, mock_web3, error):
+    """Test that individual requests are used when the RPC endpoint rejects batching."""
+    mock_web3_instance = mock_web3.return_value
+    mock_web3_instance.batch_requests.side_effect = error
+    mock_web3_instance.eth.get_transaction_count.return_value = 3
+
+    transaction = mocked_wallet_provider._prepare_transaction(
+        {"to": MOCK_ADDRESS_TO, "value": MOCK_ONE_ETH_WEI, "data": "0x"}
+    )
+
+    assert transaction["nonce"] == 3
+    mock_web3_instance.eth.get_block.assert_called_once_with("latest")
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        requests.Timeout("Read timed out"),
+        requests.ConnectionError("Connection refused"),
+        RequestTimedOut("timeout"),
+    ],
+)
+def test_prepare_transaction_batch_timeout_propagates(mocked_wallet_provider, mock_web3, error):
+    """Test that a timed out or failed batch request is raised instead of retried individually."""
+    mock_web3_instance = mock_web3.return_value
+    mock_web3_instance.batch_requests.return_value.execute.side_effect = error
+
+    with pytest.raises(type(error)):
+        mocked_wallet_provider._prepare_transaction(
+            {"to": MOCK_ADDRESS_TO, "value": MOCK_ONE_ETH_WEI, "data": "0x"}
+        )
+
+    # Only the calls queued on the batch, none from the individual-request fallback
+    mock_web3_instance.eth.get_transaction_count.assert_called_once_with(MOCK_ADDRESS)
+    mock_web3_instance.eth.get_block.assert_called_once_with("latest")
+
+
+def test_nonce_and_latest_block_batch_leaves_other_threads_untouched(
+    mocked_wallet_provider, json_rpc_server
+):
+    """Test that a call from another thread during the nonce/block batch still gets its result."""
+    get_web3.cache_clear()
+    mocked_wallet_provider._web3 = get_web3(json_rpc_server.url)
+
+    try:
+        (nonce, latest_block), call_result = call_during_batch(
+            json_rpc_server,
+            mocked_wallet_provider._get_nonce_and_latest_block,
+            lambda: mocked_wallet_provider._web3.eth.get_transaction_count(MOCK_ADDRESS),
+        )
+    finally:
+        get_web3.cache_clear()
+
+    assert nonce == MOCK_RPC_TRANSACTION_COUNT
+    assert latest_block["baseFeePerGas"] == int(MOCK_RPC_BLOCK["baseFeePerGas"], 16)
+    assert call_result == MOCK_RPC_TRANSACTION_COUNT
+
+
 def test_wait_for_transaction_receipt(mocked_wallet_provider, mock_web3):
     """Test wait_for_transaction_receipt method."""
     tx_hash = "0x1234567890123456789012345678901234567890123456789012345678901234"
@@ -251,6 +351,82 @@ def test_native_transfer_with_invalid_address(mocked_wallet_provider):
         mocked_wallet_provider.native_transfer(invalid_address, Decimal("1.0"))
 
 
+def test_native_transfer_many(mocked_wallet_provider, mock_wallet):
+    """Test native_transfer_many broadcasts every transfer before waiting on any of them."""
+    provider_wallet = mocked_wallet_provider._wallet
+    transfers = [(MOCK_ADDRESS_TO, Decimal("0.5")), (MOCK_ADDRESS_TO, Decimal("1.5"))]
+
+    events = []
+    transfer_result = provider_wallet.transfer.return_value
+
+    def record_transfer(**kwargs):
+        events.append("transfer")
+        return transfer_result
+
+    def record_wait():
+        events.append("wait")
+
+    provider_wallet.transfer.side_effect = record_transfer
+    transfer_result.wait.side_effect = record_wait
+
+    with patch(
+        "coinbase_agentkit.wallet_providers.cdp_wallet_provider.Web3.to_checksum_address",
+        return_value=MOCK_ADDRESS_TO,
+    ):
+        tx_hashes = mocked_wallet_provider.native_transfer_many(transfers)
+
+    assert tx_hashes == [MOCK_TRANSACTION_HASH, MOCK_TRANSACTION_HASH]
+    assert events == ["transfer", "transfer", "wait", "wait"]
+    assert provider_wallet.transfer.call_args_list == [
+        call(amount=Decimal("0.5"), asset_id="eth", destination=MOCK_ADDRESS_TO, gasless=False),
+        call(amount=Decimal("1.5"), asset_id="eth", destination=MOCK_ADDRESS_TO, gasless=False),
+    ]
+
+
+def test_native_transfer_many_failure(mocked_wallet_provider, mock_wallet):
+    """Test native_transfer_many method when a transfer fails."""
+    mock_wallet.transfer.side_effect = Exception("Transfer failed")
+
+    with pytest.raises(Exception, match="Failed to transfer native tokens"):
+        mocked_wallet_provider.native_transfer_many([("0x1234", Decimal("0.5"))])
+
+
+def test_native_transfer_many_partial_broadcast_failure(mocked_wallet_provider, mock_wallet):
+    """Test native_transfer_many reports the hashes of transfers sent before one fails."""
+    sent = Mock(transaction_hash="0xsent")
+    mock_wallet.transfer.side_effect = [sent, Exception("Insufficient funds")]
+
+    with pytest.raises(BatchTransferError, match="Failed to transfer native tokens") as exc_info:
+        mocked_wallet_provider.native_transfer_many(
+            [(MOCK_ADDRESS_TO, Decimal("0.5")), (MOCK_ADDRESS_TO, Decimal("1.5"))]
+        )
+
+    assert exc_info.value.tx_hashes == ["0xsent"]
+    sent.wait.assert_not_called()
+
+
+def test_native_transfer_many_wait_failure(mocked_wallet_provider, mock_wallet):
+    """Test native_transfer_many reports every broadcast hash when waiting on one fails."""
+    first = Mock(transaction_hash="0xfirst")
+    second = Mock(transaction_hash="0xsecond")
+    first.wait.side_effect = TimeoutError("Transfer timed out")
+    mock_wallet.transfer.side_effect = [first, second]
+
+    with pytest.raises(BatchTransferError, match="Transfer timed out") as exc_info:
+        mocked_wallet_provider.native_transfer_many(
+            [(MOCK_ADDRESS_TO, Decimal("0.5")), (MOCK_ADDRESS_TO, Decimal("1.5"))]
+        )
+
+    assert exc_info.value.tx_hashes == ["0xfirst", "0xsecond"]
+
+
+def test_native_transfer_many_without_wallet(mocked_wallet_provider):
+    """Test native_transfer_many method when wallet is not initialized."""
+    mocked_wallet_provider._wallet = None
+    with pytest.raises(Exception, match="Wallet not initialized"):
+        mocked_wallet_provider.native_transfer_many([("0x1234", Decimal("0.5"))])
+
+
 def test_gasless_transfer(mocked_wallet_provider, mock_wallet):
     """Test gasless transfer functionality."""
     provider_wallet = mocked_wallet_provider._wallet
@@ -0,0 +1,111 @@
+"""Shared fixtures for wallet provider tests."""
+
+import json
+import threading
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+MOCK_RPC_TRANSACTION_COUNT = 7
+MOCK_RPC_CALL_RESULT = 42
+MOCK_RPC_BLOCK = {
+    "number": "0x10",
+    "hash": "0x" + "ab" * 32,
+    "baseFeePerGas": "0x3b9aca00",
+}
+
+RPC_RESULTS = {
+    "eth_chainId": "0x14a34",
+    "eth_getTransactionCount": hex(MOCK_RPC_TRANSACTION_COUNT),
+    "eth_getBlockByNumber": MOCK_RPC_BLOCK,
+    "eth_getBalance": hex(10**18),
+    "eth_call": "0x" + f"{MOCK_RPC_CALL_RESULT:064x}",
+}
+
+
+class JsonRpcServer(ThreadingHTTPServer):
+    """A local JSON-RPC server answering single and batch requests with canned results."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        """Start listening on a free local port."""
+        super().__init__(("127.0.0.1", 0), _JsonRpcHandler)
+        self.on_batch: Callable[[], None] | None = None
+
+    @property
+    def url(self) -> str:
+        """The HTTP URL of the server."""
+        host, port = self.server_address
+        return f"http://{host}:{port}"
+
+
+class _JsonRpcHandler(BaseHTTPRequestHandler):
+    def do_POST(self):  # noqa: N802
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+
+        if isinstance(body, list):
+            if self.server.on_batch is not None:
+                self.server.on_batch()
+            response = [self._respond(request) for request in body]
+        else:
+            response = self._respond(body)
+
+        payload = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _respond(self, request):
+        return {"jsonrpc": "2.0", "id": request["id"], "result": RPC_RESULTS[request["method"]]}
+
+    def log_message(self, format, *args):
+        pass
+
+
+def call_during_batch(
+    server: JsonRpcServer, batch: Callable[[], Any], call: Callable[[], Any], timeout: float = 5
+) -> tuple[Any, Any]:
+    """Run call on this thread while another thread's batch request is held open by the server.
+
+    Returns:
+        tuple[Any, Any]: The results of batch and call
+
+    """
+    batch_sent = threading.Event()
+    call_done = threading.Event()
+
+    def hold_batch():
+        batch_sent.set()
+        call_done.wait(timeout)
+
+    server.on_batch = hold_batch
+    batch_results = []
+    batch_thread = threading.Thread(target=lambda: batch_results.append(batch()))
+    batch_thread.start()
+
+    assert batch_sent.wait(timeout)
+    try:
+        call_result = call()
+    finally:
+        call_done.set()
+    batch_thread.join(timeout)
+
+    return batch_results[0], call_result
+
+
+@pytest.fixture
+def json_rpc_server():
+    """Run a local JSON-RPC server for tests that need real Web3 clients."""
+    server = JsonRpcServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
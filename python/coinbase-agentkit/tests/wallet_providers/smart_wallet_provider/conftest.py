@@ -6,6 +6,7 @@ import pytest
 from cdp import SmartWallet, UserOperation
 from eth_account.account import LocalAccount
 
+from coinbase_agentkit.network import ChainInfo
 from coinbase_agentkit.wallet_providers.smart_wallet_provider import (
     SmartWalletProvider,
     SmartWalletProviderConfig,
@@ -41,7 +42,7 @@ MOCK_TRANSACTION = {"to": MOCK_ADDRESS_TO, "value": MOCK_ONE_ETH_WEI, "data": "0
 @pytest.fixture
 def mock_cdp():
     """Create a mock for CDP SDK."""
-    with patch("coinbase_agentkit.wallet_providers.smart_wallet_provider.Cdp") as mock_cdp:
+    with patch("coinbase_agentkit.wallet_providers.evm_wallet_provider.Cdp") as mock_cdp:
         yield mock_cdp
 
 
@@ -87,7 +88,7 @@ def mock_smart_wallet():
 @pytest.fixture
 def mock_web3():
     """Create a mock Web3 instance."""
-    with patch("coinbase_agentkit.wallet_providers.smart_wallet_provider.Web3") as mock_web3:
+    with patch("coinbase_agentkit.wallet_providers.smart_wallet_provider.get_web3") as mock_web3:
         mock_web3_instance = Mock()
         mock_web3.return_value = mock_web3_instance
 
@@ -102,22 +103,17 @@ def mock_web3():
         mock_contract.functions = {"testFunction": lambda *args: mock_function}
         mock_web3_instance.eth.contract.return_value = mock_contract
 
-        mock_web3.to_wei.return_value = MOCK_ONE_ETH_WEI
-
         yield mock_web3
 
 
 @pytest.fixture
 def mock_network_id_to_chain():
-    """Create a mock for NETWORK_ID_TO_CHAIN."""
-    mock_chain = Mock()
-    mock_chain.id = MOCK_CHAIN_ID
-    mock_chain.rpc_urls = {"default": Mock(http=[MOCK_RPC_URL])}
-
-    network_dict = {MOCK_NETWORK_ID: mock_chain}
+    """Create a mock for NETWORK_ID_TO_CHAIN_INFO."""
+    network_dict = {MOCK_NETWORK_ID: ChainInfo(id=MOCK_CHAIN_ID, rpc_url=MOCK_RPC_URL)}
 
     with patch(
-        "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN", network_dict
+        "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN_INFO",
+        network_dict,
     ):
         yield network_dict
 
@@ -1,10 +1,12 @@
 """tests for smart wallet provider basic methods."""
 
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 
 from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers.smart_wallet_provider import BALANCE_CACHE_TTL
 
 from .conftest import (
     MOCK_ADDRESS,
@@ -50,6 +52,37 @@ def test_get_balance(wallet_provider, mock_web3):
     mock_web3.return_value.eth.get_balance.assert_called_once_with(MOCK_ADDRESS)
 
 
+def test_get_balance_is_cached(wallet_provider, mock_web3):
+    """Test get_balance reuses a fresh balance instead of querying the RPC again."""
+    mock_web3.return_value.eth.get_balance.return_value = MOCK_ONE_ETH_WEI
+
+    assert wallet_provider.get_balance() == Decimal(MOCK_ONE_ETH_WEI)
+    assert wallet_provider.get_balance() == Decimal(MOCK_ONE_ETH_WEI)
+
+    mock_web3.return_value.eth.get_balance.assert_called_once_with(MOCK_ADDRESS)
+
+
+def test_get_balance_cache_expires(wallet_provider, mock_web3):
+    """Test get_balance queries the RPC again once the cached balance is stale."""
+    mock_web3.return_value.eth.get_balance.side_effect = [MOCK_ONE_ETH_WEI, 0]
+
+    with patch(
+        "coinbase_agentkit.wallet_providers.smart_wallet_provider.time.monotonic",
+        side_effect=[100.0, 100.0 + BALANCE_CACHE_TTL],
+    ):
+        assert wallet_provider.get_balance() == Decimal(MOCK_ONE_ETH_WEI)
+        assert wallet_provider.get_balance() == Decimal(0)
+
+
+def test_get_balance_refreshed_after_transfer(wallet_provider, mock_web3):
+    """Test a native transfer invalidates the cached balance."""
+    mock_web3.return_value.eth.get_balance.side_effect = [MOCK_ONE_ETH_WEI, 0]
+
+    assert wallet_provider.get_balance() == Decimal(MOCK_ONE_ETH_WEI)
+    wallet_provider.native_transfer(MOCK_ADDRESS, Decimal("1"))
+    assert wallet_provider.get_balance() == Decimal(0)
+
+
 def test_get_balance_with_zero(wallet_provider, mock_web3):
     """Test get_balance method with zero balance."""
     mock_web3.return_value.eth.get_balance.return_value = 0
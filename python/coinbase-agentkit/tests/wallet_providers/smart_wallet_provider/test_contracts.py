@@ -1,10 +1,17 @@
 """Tests for Smart Wallet Provider contract operations."""
 
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 import pytest
 from web3.exceptions import ContractLogicError
 
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import ContractCache, get_web3
+from coinbase_agentkit.wallet_providers.smart_wallet_provider import (
+    MULTICALL3_ABI,
+    MULTICALL3_ADDRESS,
+)
+
+from ..conftest import MOCK_RPC_CALL_RESULT, call_during_batch
 from .conftest import MOCK_ADDRESS_TO
 
 # =========================================================
@@ -211,3 +218,115 @@ def test_read_contract_with_invalid_address(wallet_provider, mock_web3):
 
     with pytest.raises(ValueError, match="Invalid address"):
         wallet_provider.read_contract(invalid_address, abi, "testFunction")
+
+
+def test_read_contract_reuses_contract(wallet_provider, mock_web3):
+    """Test read_contract reuses the cached contract for the same address and ABI."""
+    abi = [{"name": "testFunction", "type": "function", "inputs": [], "outputs": []}]
+
+    wallet_provider.read_contract(MOCK_ADDRESS_TO, abi, "testFunction")
+    wallet_provider.read_contract(MOCK_ADDRESS_TO, abi, "testFunction")
+
+    mock_web3.return_value.eth.contract.assert_called_once_with(address=MOCK_ADDRESS_TO, abi=abi)
+
+
+def test_read_contract_batch(wallet_provider, mock_web3):
+    """Test read_contract_batch sends every read in one batch request."""
+    abi = [{"name": "testFunction", "type": "function", "inputs": [], "outputs": []}]
+    batch = MagicMock()
+    batch.execute.return_value = ["first", "second"]
+    mock_web3.return_value.batch_requests.return_value = MagicMock()
+    mock_web3.return_value.batch_requests.return_value.__enter__.return_value = batch
+
+    mock_function = Mock()
+    mock_contract = Mock()
+    mock_contract.functions = {"testFunction": lambda *args: mock_function}
+    mock_web3.return_value.eth.contract.return_value = mock_contract
+
+    result = wallet_provider.read_contract_batch(
+        [(MOCK_ADDRESS_TO, abi, "testFunction", None), (MOCK_ADDRESS_TO, abi, "testFunction", [1])],
+        block_identifier=123,
+    )
+
+    assert result == ["first", "second"]
+    assert batch.add.call_count == 2
+    mock_function.call.assert_called_with(block_identifier=123)
+    batch.execute.assert_called_once_with()
+    mock_web3.return_value.eth.contract.assert_called_once_with(address=MOCK_ADDRESS_TO, abi=abi)
+
+
+def test_read_contract_batch_error(wallet_provider, mock_web3):
+    """Test read_contract_batch when the batch request fails."""
+    abi = [{"name": "testFunction", "type": "function", "inputs": [], "outputs": []}]
+    batch = MagicMock()
+    batch.execute.side_effect = ContractLogicError("execution reverted")
+    mock_web3.return_value.batch_requests.return_value = MagicMock()
+    mock_web3.return_value.batch_requests.return_value.__enter__.return_value = batch
+
+    with pytest.raises(ContractLogicError, match="execution reverted"):
+        wallet_provider.read_contract_batch([(MOCK_ADDRESS_TO, abi, "testFunction", None)])
+
+
+def test_read_contract_batch_leaves_other_threads_untouched(wallet_provider, json_rpc_server):
+    """Test that a read from another thread during read_contract_batch still gets its result."""
+    abi = [
+        {
+            "name": "totalSupply",
+            "type": "function",
+            "stateMutability": "view",
+            "inputs": [],
+            "outputs": [{"name": "", "type": "uint256"}],
+        }
+    ]
+    get_web3.cache_clear()
+    wallet_provider._web3 = get_web3(json_rpc_server.url)
+    wallet_provider._contract_cache = ContractCache(wallet_provider._web3)
+
+    try:
+        batch_result, call_result = call_during_batch(
+            json_rpc_server,
+            lambda: wallet_provider.read_contract_batch(
+                [(MOCK_ADDRESS_TO, abi, "totalSupply", None)] * 2
+            ),
+            lambda: wallet_provider.read_contract(MOCK_ADDRESS_TO, abi, "totalSupply"),
+        )
+    finally:
+        get_web3.cache_clear()
+
+    assert batch_result == [MOCK_RPC_CALL_RESULT, MOCK_RPC_CALL_RESULT]
+    assert call_result == MOCK_RPC_CALL_RESULT
+
+
+def test_multicall(wallet_provider, mock_web3):
+    """Test multicall aggregates every call into one Multicall3 eth_call."""
+    aggregate3 = Mock()
+    aggregate3.return_value.call.return_value = [(True, b"\x01"), (True, b"\x02")]
+    mock_contract = Mock()
+    mock_contract.functions = {"aggregate3": aggregate3}
+    mock_web3.return_value.eth.contract.return_value = mock_contract
+
+    result = wallet_provider.multicall(
+        [(MOCK_ADDRESS_TO, "0x313ce567"), (MOCK_ADDRESS_TO, b"\x95\xd8\x9b\x41")],
+        block_identifier=123,
+    )
+
+    assert result == [b"\x01", b"\x02"]
+    mock_web3.return_value.eth.contract.assert_called_once_with(
+        address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI
+    )
+    aggregate3.assert_called_once_with(
+        [(MOCK_ADDRESS_TO, False, "0x313ce567"), (MOCK_ADDRESS_TO, False, b"\x95\xd8\x9b\x41")]
+    )
+    aggregate3.return_value.call.assert_called_once_with(block_identifier=123)
+
+
+def test_multicall_error(wallet_provider, mock_web3):
+    """Test multicall when one of the calls reverts."""
+    aggregate3 = Mock()
+    aggregate3.return_value.call.side_effect = ContractLogicError("execution reverted")
+    mock_contract = Mock()
+    mock_contract.functions = {"aggregate3": aggregate3}
+    mock_web3.return_value.eth.contract.return_value = mock_contract
+
+    with pytest.raises(ContractLogicError, match="execution reverted"):
+        wallet_provider.multicall([(MOCK_ADDRESS_TO, "0x313ce567")])
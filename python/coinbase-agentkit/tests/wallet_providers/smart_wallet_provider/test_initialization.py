@@ -5,6 +5,7 @@ from unittest.mock import ANY, Mock, patch
 import pytest
 from pydantic import ValidationError
 
+from coinbase_agentkit.network import ChainInfo
 from coinbase_agentkit.wallet_providers.smart_wallet_provider import (
     SmartWalletProvider,
     SmartWalletProviderConfig,
@@ -31,12 +32,8 @@ def test_init_with_api_keys(mock_cdp, mock_signer, mock_smart_wallet):
             "coinbase_agentkit.wallet_providers.smart_wallet_provider.SmartWallet"
         ) as mock_smart_wallet_class,
         patch(
-            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN",
-            {
-                MOCK_NETWORK_ID: Mock(
-                    id=MOCK_CHAIN_ID, rpc_urls={"default": Mock(http=[MOCK_RPC_URL])}
-                )
-            },
+            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN_INFO",
+            {MOCK_NETWORK_ID: ChainInfo(id=MOCK_CHAIN_ID, rpc_url=MOCK_RPC_URL)},
         ),
     ):
         mock_smart_wallet_class.create.return_value = mock_smart_wallet
@@ -71,12 +68,8 @@ def test_init_without_api_keys(mock_cdp, mock_signer, mock_smart_wallet):
             "coinbase_agentkit.wallet_providers.smart_wallet_provider.SmartWallet"
         ) as mock_smart_wallet_class,
         patch(
-            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN",
-            {
-                MOCK_NETWORK_ID: Mock(
-                    id=MOCK_CHAIN_ID, rpc_urls={"default": Mock(http=[MOCK_RPC_URL])}
-                )
-            },
+            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN_INFO",
+            {MOCK_NETWORK_ID: ChainInfo(id=MOCK_CHAIN_ID, rpc_url=MOCK_RPC_URL)},
         ),
     ):
         mock_smart_wallet_class.create.return_value = mock_smart_wallet
@@ -104,16 +97,12 @@ def test_init_with_env_vars(mock_cdp, mock_signer, mock_smart_wallet):
             "coinbase_agentkit.wallet_providers.smart_wallet_provider.SmartWallet"
         ) as mock_smart_wallet_class,
         patch(
-            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN",
-            {
-                MOCK_NETWORK_ID: Mock(
-                    id=MOCK_CHAIN_ID, rpc_urls={"default": Mock(http=[MOCK_RPC_URL])}
-                )
-            },
+            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN_INFO",
+            {MOCK_NETWORK_ID: ChainInfo(id=MOCK_CHAIN_ID, rpc_url=MOCK_RPC_URL)},
         ),
         patch.dict("os.environ", mock_env_vars, clear=True),
         patch(
-            "coinbase_agentkit.wallet_providers.smart_wallet_provider.Cdp.configure_from_json"
+            "coinbase_agentkit.wallet_providers.evm_wallet_provider.Cdp.configure_from_json"
         ) as mock_configure_from_json,
     ):
         mock_smart_wallet_class.create.return_value = mock_smart_wallet
@@ -136,12 +125,8 @@ def test_init_with_existing_wallet(mock_cdp, mock_signer, mock_smart_wallet):
             "coinbase_agentkit.wallet_providers.smart_wallet_provider.to_smart_wallet"
         ) as mock_to_smart_wallet,
         patch(
-            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN",
-            {
-                MOCK_NETWORK_ID: Mock(
-                    id=MOCK_CHAIN_ID, rpc_urls={"default": Mock(http=[MOCK_RPC_URL])}
-                )
-            },
+            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN_INFO",
+            {MOCK_NETWORK_ID: ChainInfo(id=MOCK_CHAIN_ID, rpc_url=MOCK_RPC_URL)},
         ),
     ):
         mock_to_smart_wallet.return_value = mock_smart_wallet
@@ -164,12 +149,8 @@ def test_init_with_invalid_wallet_address(mock_cdp, mock_signer):
 
     with (
         patch(
-            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN",
-            {
-                MOCK_NETWORK_ID: Mock(
-                    id=MOCK_CHAIN_ID, rpc_urls={"default": Mock(http=[MOCK_RPC_URL])}
-                )
-            },
+            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN_INFO",
+            {MOCK_NETWORK_ID: ChainInfo(id=MOCK_CHAIN_ID, rpc_url=MOCK_RPC_URL)},
         ),
         patch(
             "coinbase_agentkit.wallet_providers.smart_wallet_provider.to_smart_wallet",
@@ -193,12 +174,8 @@ def test_init_with_paymaster_url(mock_cdp, mock_signer, mock_smart_wallet):
             "coinbase_agentkit.wallet_providers.smart_wallet_provider.SmartWallet"
         ) as mock_smart_wallet_class,
         patch(
-            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN",
-            {
-                MOCK_NETWORK_ID: Mock(
-                    id=MOCK_CHAIN_ID, rpc_urls={"default": Mock(http=[MOCK_RPC_URL])}
-                )
-            },
+            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN_INFO",
+            {MOCK_NETWORK_ID: ChainInfo(id=MOCK_CHAIN_ID, rpc_url=MOCK_RPC_URL)},
         ),
     ):
         mock_smart_wallet_class.create.return_value = mock_smart_wallet
@@ -221,29 +198,22 @@ def test_init_with_custom_rpc_url(mock_cdp, mock_signer, mock_smart_wallet):
             "coinbase_agentkit.wallet_providers.smart_wallet_provider.SmartWallet"
         ) as mock_smart_wallet_class,
         patch(
-            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN",
-            {
-                MOCK_NETWORK_ID: Mock(
-                    id=MOCK_CHAIN_ID, rpc_urls={"default": Mock(http=[MOCK_RPC_URL])}
-                )
-            },
+            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN_INFO",
+            {MOCK_NETWORK_ID: ChainInfo(id=MOCK_CHAIN_ID, rpc_url=MOCK_RPC_URL)},
         ),
-        patch("coinbase_agentkit.wallet_providers.smart_wallet_provider.Web3") as mock_web3_class,
+        patch("coinbase_agentkit.wallet_providers.smart_wallet_provider.get_web3") as mock_get_web3,
     ):
         mock_smart_wallet_class.create.return_value = mock_smart_wallet
-        mock_http_provider = Mock()
-        mock_web3_class.HTTPProvider.return_value = mock_http_provider
-        mock_web3_instance = Mock()
-        mock_web3_class.return_value = mock_web3_instance
 
         config = SmartWalletProviderConfig(
             network_id=MOCK_NETWORK_ID,
             signer=mock_signer,
         )
 
-        SmartWalletProvider(config)
+        provider = SmartWalletProvider(config)
 
-        mock_web3_class.HTTPProvider.assert_called_once_with(MOCK_RPC_URL)
+        mock_get_web3.assert_called_once_with(MOCK_RPC_URL)
+        assert provider._web3 is mock_get_web3.return_value
 
         assert hasattr(mock_smart_wallet, "use_network_kwargs")
         assert mock_smart_wallet.use_network_kwargs.get("chain_id") == int(MOCK_CHAIN_ID)
@@ -259,20 +229,12 @@ def test_init_with_all_options(mock_cdp, mock_signer, mock_smart_wallet):
             "coinbase_agentkit.wallet_providers.smart_wallet_provider.SmartWallet"
         ) as mock_smart_wallet_class,
         patch(
-            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN",
-            {
-                MOCK_NETWORK_ID: Mock(
-                    id=MOCK_CHAIN_ID, rpc_urls={"default": Mock(http=[MOCK_RPC_URL])}
-                )
-            },
+            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN_INFO",
+            {MOCK_NETWORK_ID: ChainInfo(id=MOCK_CHAIN_ID, rpc_url=MOCK_RPC_URL)},
         ),
-        patch("coinbase_agentkit.wallet_providers.smart_wallet_provider.Web3") as mock_web3_class,
+        patch("coinbase_agentkit.wallet_providers.smart_wallet_provider.get_web3") as mock_get_web3,
     ):
         mock_smart_wallet_class.create.return_value = mock_smart_wallet
-        mock_http_provider = Mock()
-        mock_web3_class.HTTPProvider.return_value = mock_http_provider
-        mock_web3_instance = Mock()
-        mock_web3_class.return_value = mock_web3_instance
 
         config = SmartWalletProviderConfig(
             network_id=MOCK_NETWORK_ID,
@@ -291,7 +253,7 @@ def test_init_with_all_options(mock_cdp, mock_signer, mock_smart_wallet):
             source_version=ANY,
         )
 
-        mock_web3_class.HTTPProvider.assert_called_once_with(MOCK_RPC_URL)
+        mock_get_web3.assert_called_once_with(MOCK_RPC_URL)
 
         call_args = mock_smart_wallet.use_network_kwargs
         assert call_args.get("paymaster_url") == paymaster_url
@@ -305,12 +267,8 @@ def test_init_smart_wallet_creation_failure(mock_cdp, mock_signer):
             "coinbase_agentkit.wallet_providers.smart_wallet_provider.SmartWallet"
         ) as mock_smart_wallet_class,
         patch(
-            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN",
-            {
-                MOCK_NETWORK_ID: Mock(
-                    id=MOCK_CHAIN_ID, rpc_urls={"default": Mock(http=[MOCK_RPC_URL])}
-                )
-            },
+            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN_INFO",
+            {MOCK_NETWORK_ID: ChainInfo(id=MOCK_CHAIN_ID, rpc_url=MOCK_RPC_URL)},
         ),
         pytest.raises(Exception, match="Failed to create smart wallet"),
     ):
@@ -327,12 +285,8 @@ def test_init_with_invalid_network_id(mock_cdp, mock_signer):
 
     with (
         patch(
-            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN",
-            {
-                MOCK_NETWORK_ID: Mock(
-                    id=MOCK_CHAIN_ID, rpc_urls={"default": Mock(http=[MOCK_RPC_URL])}
-                )
-            },
+            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN_INFO",
+            {MOCK_NETWORK_ID: ChainInfo(id=MOCK_CHAIN_ID, rpc_url=MOCK_RPC_URL)},
         ),
         pytest.raises(KeyError, match=invalid_network_id),
     ):
@@ -340,13 +294,21 @@ def test_init_with_invalid_network_id(mock_cdp, mock_signer):
         SmartWalletProvider(config)
 
 
+def test_init_with_invalid_network_id_lists_supported_networks(mock_cdp, mock_signer):
+    """Test initialization with an invalid network ID reports the supported networks."""
+    config = SmartWalletProviderConfig(network_id="invalid-network", signer=mock_signer)
+
+    with pytest.raises(KeyError, match="Supported networks: .*base-sepolia"):
+        SmartWalletProvider(config)
+
+
 def test_init_with_cdp_error(mock_cdp, mock_signer):
     """Test initialization when CDP configuration fails."""
     error_message = "CDP configuration failed"
 
     with (
         patch(
-            "coinbase_agentkit.wallet_providers.smart_wallet_provider.Cdp.configure_from_json",
+            "coinbase_agentkit.wallet_providers.evm_wallet_provider.Cdp.configure_from_json",
             side_effect=Exception(error_message),
         ),
         pytest.raises(Exception, match=error_message),
@@ -372,12 +334,8 @@ def test_init_with_network_error(mock_cdp, mock_signer, mock_smart_wallet):
             "coinbase_agentkit.wallet_providers.smart_wallet_provider.SmartWallet"
         ) as mock_smart_wallet_class,
         patch(
-            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN",
-            {
-                MOCK_NETWORK_ID: Mock(
-                    id=MOCK_CHAIN_ID, rpc_urls={"default": Mock(http=[MOCK_RPC_URL])}
-                )
-            },
+            "coinbase_agentkit.wallet_providers.smart_wallet_provider.NETWORK_ID_TO_CHAIN_INFO",
+            {MOCK_NETWORK_ID: ChainInfo(id=MOCK_CHAIN_ID, rpc_url=MOCK_RPC_URL)},
         ),
         pytest.raises(Exception, match="Failed to configure network"),
     ):
@@ -28,6 +28,35 @@ def test_send_transaction(wallet_provider, mock_smart_wallet):
     assert call_args.data == transaction["data"]
 
 
+def test_send_transactions(wallet_provider, mock_smart_wallet):
+    """Test send_transactions bundles every transaction into one user operation."""
+    transactions = [
+        {"to": MOCK_ADDRESS_TO, "data": "0x095ea7b3"},
+        {"to": MOCK_ADDRESS_TO, "value": MOCK_ONE_ETH_WEI, "data": "0x"},
+    ]
+
+    tx_hash = wallet_provider.send_transactions(transactions)
+
+    assert tx_hash == MOCK_TRANSACTION_HASH
+    mock_smart_wallet.send_user_operation.assert_called_once()
+
+    calls = mock_smart_wallet.send_user_operation.call_args[1]["calls"]
+    assert [(call.to, call.value, call.data) for call in calls] == [
+        (MOCK_ADDRESS_TO, 0, "0x095ea7b3"),
+        (MOCK_ADDRESS_TO, MOCK_ONE_ETH_WEI, "0x"),
+    ]
+
+
+def test_send_transactions_failure(wallet_provider, mock_smart_wallet):
+    """Test send_transactions when the user operation fails."""
+    mock_smart_wallet.send_user_operation.return_value.wait.return_value.status = (
+        UserOperation.Status.FAILED
+    )
+
+    with pytest.raises(Exception, match="Operation failed with status"):
+        wallet_provider.send_transactions([{"to": MOCK_ADDRESS_TO, "data": "0x"}])
+
+
 def test_send_transaction_without_data(wallet_provider, mock_smart_wallet):
     """Test send_transaction method with no data field."""
     transaction = {"to": MOCK_ADDRESS_TO, "value": MOCK_ONE_ETH_WEI}
@@ -221,17 +250,14 @@ def test_wait_for_transaction_receipt_timeout(wallet_provider, mock_web3):
         wallet_provider.wait_for_transaction_receipt(tx_hash)
 
 
-def test_native_transfer(wallet_provider, mock_smart_wallet, mock_web3):
+def test_native_transfer(wallet_provider, mock_smart_wallet):
     """Test native_transfer method."""
     to_address = MOCK_ADDRESS_TO
     amount = Decimal("1.0")
 
-    mock_web3.to_wei.return_value = MOCK_ONE_ETH_WEI
-
     tx_hash = wallet_provider.native_transfer(to_address, amount)
 
     assert tx_hash == MOCK_TRANSACTION_HASH
-    mock_web3.to_wei.assert_called_once_with(amount, "ether")
     mock_smart_wallet.send_user_operation.assert_called_once()
 
     call_args = mock_smart_wallet.send_user_operation.call_args[1]["calls"][0]
@@ -240,6 +266,14 @@ def test_native_transfer(wallet_provider, mock_smart_wallet, mock_web3):
     assert call_args.data == "0x"
 
 
+def test_native_transfer_fractional_amount(wallet_provider, mock_smart_wallet):
+    """Test native_transfer converts fractional ether amounts to wei exactly."""
+    wallet_provider.native_transfer(MOCK_ADDRESS_TO, Decimal("0.000000000000000123"))
+
+    call_args = mock_smart_wallet.send_user_operation.call_args[1]["calls"][0]
+    assert call_args.value == 123
+
+
 def test_native_transfer_failure(wallet_provider, mock_smart_wallet):
     """Test native_transfer method failure case."""
     user_operation = Mock(spec=UserOperation)